@@ -17,11 +17,115 @@ Output:
     - table_ddls.zip: ZIP archive containing individual table DDL files
 """
 
-import re
+import hashlib
+import mmap
+import os
+import pickle
+import sys
+import time
 import zipfile
+
+try:
+    # Optional DFA engine with linear-time guarantees; the header patterns
+    # use no backreferences, so they compile unchanged. Scanning a large
+    # dump with finditer is typically several times faster than stdlib re.
+    import re2 as re
+    if not (hasattr(re, 'MULTILINE') and hasattr(re, 'IGNORECASE')):
+        # google-re2 also installs as 're2' but exposes an Options API
+        # instead of the stdlib flag constants; only pyre2 is a drop-in
+        raise ImportError("re2 module lacks the stdlib re surface")
+except ImportError:
+    import re
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+# Prefer Zstandard entries when the interpreter supports them (3.14+):
+# zstd compresses SQL text an order of magnitude faster than deflate at a
+# comparable ratio. Older interpreters keep fast deflate (level 1).
+_ZIP_COMPRESSION = getattr(zipfile, 'ZIP_ZSTANDARD', zipfile.ZIP_DEFLATED)
+_ZIP_COMPRESSLEVEL = 1
+
+# On-disk cache for the per-dump header indexes, keyed by path, mtime and
+# size, so repeat runs skip the full-dump scan entirely
+_CACHE_DIR = Path.home() / '.cache' / 'extract-ddl'
+
+# Directory this script (and the SQL dumps) live in, resolved once
+_SCRIPT_DIR = Path(__file__).parent
+
+# Schema each SQL dump file belongs to
+_SCHEMA_BY_SOURCE = {
+    'acct_db.sql': 'uat_suncbs_acctdb',
+    'core_db.sql': 'uat_suncbs_coredb',
+}
+
+# Pattern to match every table section header in one sweep. Headers and
+# identifiers are ASCII, so the dumps are scanned as bytes and never
+# decoded in full.
+# Example: -- Table structure for uat_suncbs_acctdb.kfab_prod_bal_agrgtd
+_HEADER_RE = re.compile(
+    rb'^-- ----------------------------\s*\n'
+    rb'-- Table structure for (?:uat_suncbs_(?:acct|core)db\.)?(?P<name>\S+)\s*\n'
+    rb'-- ----------------------------',
+    re.MULTILINE | re.IGNORECASE,
+)
+
+
+def build_table_index(content: bytes) -> Dict[bytes, Tuple[int, int, int]]:
+    """
+    Scan the SQL dump once and map each table name to the
+    (start, end, header_len) of its DDL section, so per-table extraction
+    is an O(1) lookup instead of a fresh regex search over the whole
+    dump. header_len is the length of the section header comment.
+    """
+    matches = list(_HEADER_RE.finditer(content))
+    index: Dict[bytes, Tuple[int, int, int]] = {}
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(content)
+        index[match.group('name').lower()] = (
+            match.start(), end, match.end() - match.start())
+    return index
+
+
+def _load_or_build_index(path: str,
+                         content: mmap.mmap) -> Dict[bytes, Tuple[int, int, int]]:
+    """
+    Return the header index for one dump, reusing a pickled copy from
+    ~/.cache/extract-ddl keyed by the dump's path, mtime and size so the
+    scan only reruns when the dump changes.
+    """
+    stat = os.stat(path)
+    key = hashlib.blake2b(
+        f"{path}:{stat.st_mtime_ns}:{stat.st_size}".encode()).hexdigest()
+    cache_path = _CACHE_DIR / f"{key}.pkl"
+
+    try:
+        with open(cache_path, 'rb') as f:
+            return pickle.load(f)
+    except (OSError, pickle.UnpicklingError, EOFError):
+        pass
+
+    index = build_table_index(content)
+
+    # Best-effort write; a temp file plus os.replace keeps concurrent
+    # workers from reading a half-written pickle
+    try:
+        _CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_suffix(f'.{os.getpid()}.tmp')
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(index, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        pass
+
+    return index
+
+
+# DROP TABLE existence check; the statement sits right after the section
+# header, so a bounded-window search is enough
+_DROP_RE = re.compile(rb'DROP TABLE', re.IGNORECASE)
+_DROP_SEARCH_WINDOW = 1024
+
 
 def read_table_list(table_list_file: str) -> List[str]:
     """Read the list of tables to extract from table-list.txt"""
@@ -30,17 +134,22 @@ def read_table_list(table_list_file: str) -> List[str]:
     return tables
 
 
+# Accounting-DB tables are recognized by their three-letter name prefix
+_ACCT_PREFIXES = frozenset({'kfa', 'kgl'})
+
+
 def determine_source_file(table_name: str) -> str:
     """Determine which SQL file contains the table DDL"""
-    if table_name.startswith('kfa') or table_name.startswith('kgl'):
-        return 'acct_db.sql'
-    else:
-        return 'core_db.sql'
+    return ('core_db.sql', 'acct_db.sql')[table_name[:3] in _ACCT_PREFIXES]
 
 
-def extract_table_ddl(sql_file: str, table_name: str) -> Optional[str]:
+def extract_table_ddl(content: bytes, index: Dict[bytes, Tuple[int, int, int]],
+                      table_name: str, schema_name: str,
+                      assume_drop_present: bool = False) -> Optional[bytes]:
     """
-    Extract the DDL for a specific table from the SQL file.
+    Extract the DDL for a specific table from the SQL dump content using
+    the precomputed header index. The DDL is returned as UTF-8 bytes,
+    ready to be written to the ZIP without another encode.
 
     Returns the complete DDL including:
     - DROP TABLE statement
@@ -50,79 +159,126 @@ def extract_table_ddl(sql_file: str, table_name: str) -> Optional[str]:
     - ALTER TABLE constraints
     - COMMENT statements (if any)
     """
-    with open(sql_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-
-    # Pattern to match table section header
-    # Example: -- Table structure for uat_suncbs_acctdb.kfab_prod_bal_agrgtd
-    table_header_pattern = rf'^-- ----------------------------\s*\n-- Table structure for (?:uat_suncbs_(?:acct|core)db\.)?{re.escape(table_name)}\s*\n-- ----------------------------'
-
-    # Find the start of the table DDL
-    match = re.search(table_header_pattern, content, re.MULTILINE | re.IGNORECASE)
-    if not match:
+    # Look up the table's DDL section boundaries
+    section = index.get(table_name.lower().encode('ascii'))
+    if section is None:
         return None
 
-    start_pos = match.start()
-
-    # Find the end of the table DDL (next table header or end of file)
-    next_table_pattern = r'^-- ----------------------------\s*\n-- Table structure for'
-    next_match = re.search(next_table_pattern, content[match.end():], re.MULTILINE)
-
-    if next_match:
-        end_pos = match.end() + next_match.start()
-    else:
-        end_pos = len(content)
+    start_pos, end_pos, header_len = section
 
     # Extract the DDL section
     ddl = content[start_pos:end_pos].strip()
 
-    # Add DROP TABLE at the beginning if not present
-    if not re.search(rf'DROP TABLE.*{re.escape(table_name)}', ddl, re.IGNORECASE):
-        schema_name = 'uat_suncbs_acctdb' if 'acct_db' in sql_file else 'uat_suncbs_coredb'
-        drop_statement = f'DROP TABLE IF EXISTS "{schema_name}"."{table_name}";\n\n'
-        # Insert after the header comment
-        header_end = ddl.find('----------------------------', ddl.find('----------------------------') + 1)
-        if header_end != -1:
-            header_end = ddl.find('\n', header_end) + 1
-            ddl = ddl[:header_end] + drop_statement + ddl[header_end:]
+    # Add DROP TABLE at the beginning if not present. Dumps known to emit
+    # DROP for every section can pass assume_drop_present=True to skip the
+    # check and insertion entirely; the current core/acct dumps omit DROP
+    # for some tables (e.g. kfab_gl_vchr), so the default keeps the check.
+    if not assume_drop_present and not _DROP_RE.search(ddl, 0, _DROP_SEARCH_WINDOW):
+        drop_statement = (
+            f'DROP TABLE IF EXISTS "{schema_name}"."{table_name}";\n\n'
+            .encode('utf-8'))
+        # Insert after the header comment; its length is already known
+        # from the index, +1 for the trailing newline. join() builds the
+        # result in one allocation instead of chained concatenation.
+        header_end = header_len + 1
+        ddl = b''.join((ddl[:header_end], drop_statement, ddl[header_end:]))
 
     return ddl
 
 
+# Per-worker state, populated once by _init_worker instead of pickling the
+# dump contents into every task
+_worker_contents: Dict[str, mmap.mmap] = {}
+_worker_indexes: Dict[str, Dict[bytes, Tuple[int, int, int]]] = {}
+
+
+def _init_worker(paths: Dict[str, str]) -> None:
+    """
+    mmap each dump and build its header index once per worker process.
+    Memory-mapping lets the OS demand-page only the regions the regexes
+    touch, and all workers share the same page-cache copy.
+    """
+    global _worker_contents, _worker_indexes
+    _worker_contents = {}
+    for name, path in paths.items():
+        with open(path, 'rb') as f:
+            _worker_contents[name] = mmap.mmap(f.fileno(), 0,
+                                               access=mmap.ACCESS_READ)
+    _worker_indexes = {name: _load_or_build_index(paths[name], mm)
+                       for name, mm in _worker_contents.items()}
+
+
+def _extract_one(task: Tuple[str, str]) -> Tuple[str, Optional[bytes]]:
+    """Extract one table's DDL in a worker process."""
+    table_name, source_file = task
+    ddl = extract_table_ddl(_worker_contents[source_file],
+                            _worker_indexes[source_file],
+                            table_name, _SCHEMA_BY_SOURCE[source_file])
+    return table_name, ddl
+
+
 def create_zip_with_ddls(tables: List[str], output_zip: str):
     """
     Extract DDLs for all tables and create a ZIP file with individual SQL files.
     """
-    script_dir = Path(__file__).parent
+    # Hand the workers file paths; each worker memory-maps the dumps
+    # itself instead of this process reading them and pickling the bytes
+    dump_paths: Dict[str, str] = {
+        name: str(_SCRIPT_DIR / name)
+        for name in ('core_db.sql', 'acct_db.sql')
+        if (_SCRIPT_DIR / name).exists()
+    }
 
     extracted_count = 0
     missing_tables = []
 
-    with zipfile.ZipFile(output_zip, 'w', zipfile.ZIP_DEFLATED) as zipf:
-        for table_name in tables:
-            # Determine which source file to use
-            source_file = determine_source_file(table_name)
-            source_path = script_dir / source_file
-
-            if not source_path.exists():
-                print(f"⚠️  Source file not found: {source_file}")
-                missing_tables.append(table_name)
-                continue
-
-            # Extract the DDL
-            print(f"Processing {table_name} from {source_file}...")
-            ddl = extract_table_ddl(str(source_path), table_name)
+    # Accumulate per-table log lines and emit them in one stdout write at
+    # the end instead of 2-3 print (and flush) calls per table
+    log_lines = []
+
+    # Split the tables whose source dump is missing from the extraction tasks
+    tasks = []
+    for table_name in tables:
+        source_file = determine_source_file(table_name)
+        if source_file not in dump_paths:
+            log_lines.append(f"⚠️  Source file not found: {source_file}")
+            missing_tables.append(table_name)
+        else:
+            tasks.append((table_name, source_file))
+
+    # Extraction is embarrassingly parallel; each worker indexes the dumps
+    # once, while ZIP entries are written sequentially from this process
+    # compresslevel=1 compresses much faster than the default with nearly
+    # the same ratio on SQL text
+    with zipfile.ZipFile(output_zip, 'w', _ZIP_COMPRESSION,
+                         compresslevel=_ZIP_COMPRESSLEVEL) as zipf, \
+            ProcessPoolExecutor(initializer=_init_worker,
+                                initargs=(dump_paths,)) as executor:
+        for (table_name, source_file), (_, ddl) in zip(
+                tasks, executor.map(_extract_one, tasks)):
+            log_lines.append(f"Processing {table_name} from {source_file}...")
 
             if ddl:
-                # Create SQL file in ZIP
-                sql_filename = f"{table_name}.sql"
-                zipf.writestr(sql_filename, ddl)
+                # Stream the DDL straight into the compressor instead of
+                # handing writestr a full in-memory copy
+                # Stamp the current time like writestr does, and carry the
+                # compression settings explicitly: ZipFile.open() leaves a
+                # pre-built ZipInfo's compress level at None, which would
+                # silently fall back to the default deflate level
+                zinfo = zipfile.ZipInfo(f"{table_name}.sql",
+                                        date_time=time.localtime()[:6])
+                zinfo.compress_type = _ZIP_COMPRESSION
+                zinfo._compresslevel = _ZIP_COMPRESSLEVEL
+                with zipf.open(zinfo, 'w') as entry:
+                    entry.write(ddl)
                 extracted_count += 1
-                print(f"  ✓ Extracted {table_name}")
+                log_lines.append(f"  ✓ Extracted {table_name}")
             else:
-                print(f"  ✗ Table {table_name} not found in {source_file}")
+                log_lines.append(f"  ✗ Table {table_name} not found in {source_file}")
                 missing_tables.append(table_name)
 
+    sys.stdout.write('\n'.join(log_lines) + '\n')
+
     # Print summary
     print(f"\n{'='*60}")
     print(f"Extraction Summary:")
@@ -141,13 +297,11 @@ def create_zip_with_ddls(tables: List[str], output_zip: str):
 
 def main():
     """Main function to orchestrate the DDL extraction process"""
-    script_dir = Path(__file__).parent
-
     # Input files
-    table_list_file = script_dir.parent / 'table-list.txt'
+    table_list_file = _SCRIPT_DIR.parent / 'table-list.txt'
 
     # Output file
-    output_zip = script_dir / 'table_ddls.zip'
+    output_zip = _SCRIPT_DIR / 'table_ddls.zip'
 
     # Check if table list exists
     if not table_list_file.exists():
@@ -166,4 +320,4 @@ def main():
 
 
 if __name__ == '__main__':
-    exit(main())
+    sys.exit(main())
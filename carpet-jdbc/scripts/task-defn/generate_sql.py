@@ -7,6 +7,40 @@ Tables are categorized by database schema:
 - Core DB (sit_suncbs_coredb): all other tables
 """
 
+import os
+
+# Statement templates, compiled once at module level; the loop only fills
+# in the per-table placeholders
+_DELETE_TMPL = (
+    "delete from kapp_data_expr_defn "
+    "where lgl_pern_code = '6666' "
+    "and data_expr_id = '{data_expr_id}' "
+    "and data_expr_grp_code = '{data_expr_grp_code}' "
+    "and file_tp = 'parquet';"
+)
+
+_SELECT_TMPL = (
+    "select a.* from {table_name} a "
+    "where a.lgl_pern_code = ''${{lgl_pern_code}}'' "
+)
+
+_INSERT_TMPL = (
+    "INSERT INTO kapp_data_expr_defn "
+    "(lgl_pern_code,data_expr_id,data_expr_grp_code,data_expr_tab_nm,"
+    "expr_sql_sentc,wthr_rgst_tmstp,wthr_concurrent_exec,concurrent_num,"
+    "fld_seprtr,file_tp,file_gen_way,file_nm,file_comps_way,file_comps_type,"
+    "wthr_gen_succ_file,wthr_file_upld,file_local_path,file_remote_path,"
+    "wthr_vld,comt_info,sharding_hash_key) VALUES\n"
+    "\t ('6666','{data_expr_id}','{data_expr_grp_code}','{table_name}','{select_clause}',"
+    "'0','0',5,'@|@','parquet','0','{table_name}','0',NULL,'1','1',"
+    "'{table_name}','{table_name}','1',NULL,NULL);"
+)
+
+
+# Accounting-DB tables are recognized by their three-letter name prefix
+_ACCT_PREFIXES = frozenset({'kfa', 'kgl'})
+
+
 def get_schema_for_table(table_name):
     """
     Determine which database schema a table belongs to.
@@ -17,10 +51,7 @@ def get_schema_for_table(table_name):
     Returns:
         Schema name (sit_suncbs_acctdb or sit_suncbs_coredb)
     """
-    if table_name.startswith('kfa') or table_name.startswith('kgl'):
-        return 'sit_suncbs_acctdb'
-    else:
-        return 'sit_suncbs_coredb'
+    return ('sit_suncbs_coredb', 'sit_suncbs_acctdb')[table_name[:3] in _ACCT_PREFIXES]
 
 def generate_sql_statements(table_list_file, output_dir):
     """
@@ -34,76 +65,59 @@ def generate_sql_statements(table_list_file, output_dir):
     with open(table_list_file, 'r', encoding='utf-8') as f:
         tables = [line.strip() for line in f if line.strip()]
 
-    acct_statements = []
-    core_statements = []
-    core_db_count = 0
-    acct_db_count = 0
-
-    for table_name in tables:
-        # data_expr_id is table name (no suffix based on the example)
-        data_expr_id = table_name
-
-        # Determine which schema this table belongs to
-        schema_name = get_schema_for_table(table_name)
-
-        # Determine data_expr_grp_code based on database
-        # Accounting DB tables use 'acct', Core DB tables use 'core'
-        if schema_name == 'sit_suncbs_acctdb':
-            data_expr_grp_code = 'acct'
-            acct_db_count += 1
-            statements_list = acct_statements
-        else:
-            data_expr_grp_code = 'core'
-            core_db_count += 1
-            statements_list = core_statements
-
-        # Generate DELETE statement
-        delete_stmt = (
-            f"delete from kapp_data_expr_defn "
-            f"where lgl_pern_code = '6666' "
-            f"and data_expr_id = '{data_expr_id}' "
-            f"and data_expr_grp_code = '{data_expr_grp_code}' "
-            f"and file_tp = 'parquet';"
-        )
-
-        # Generate SELECT clause without schema qualification
-        select_clause = (
-            f"select a.* from {table_name} a "
-            f"where a.lgl_pern_code = ''${{lgl_pern_code}}'' "
-        )
-
-        # Generate INSERT statement
-        insert_stmt = (
-            f"INSERT INTO kapp_data_expr_defn "
-            f"(lgl_pern_code,data_expr_id,data_expr_grp_code,data_expr_tab_nm,"
-            f"expr_sql_sentc,wthr_rgst_tmstp,wthr_concurrent_exec,concurrent_num,"
-            f"fld_seprtr,file_tp,file_gen_way,file_nm,file_comps_way,file_comps_type,"
-            f"wthr_gen_succ_file,wthr_file_upld,file_local_path,file_remote_path,"
-            f"wthr_vld,comt_info,sharding_hash_key) VALUES\n"
-            f"\t ('6666','{data_expr_id}','{data_expr_grp_code}','{table_name}','{select_clause}',"
-            f"'0','0',5,'@|@','parquet','0','{table_name}','0',NULL,'1','1',"
-            f"'{table_name}','{table_name}','1',NULL,NULL);"
-        )
-
-        statements_list.append(delete_stmt)
-        statements_list.append(insert_stmt)
-        statements_list.append("")  # Empty line between table statements
-
-    # Write accounting DB statements to file
-    acct_output_file = os.path.join(output_dir, "acct.sql")
-    with open(acct_output_file, 'w', encoding='utf-8') as f:
-        f.write("-- Generated SQL statements for Accounting DB data export definitions\n")
-        f.write("-- Based on table-list.txt\n")
-        f.write(f"-- Accounting DB (sit_suncbs_acctdb): {acct_db_count} tables\n\n")
-        f.write('\n'.join(acct_statements))
+    # The headers need the per-schema counts, so take them from the
+    # in-memory list up front; the statements are then generated and
+    # written in one fused pass straight into the right file handle
+    acct_db_count = sum(
+        1 for name in tables
+        if get_schema_for_table(name) == 'sit_suncbs_acctdb')
+    core_db_count = len(tables) - acct_db_count
 
-    # Write core DB statements to file
+    acct_output_file = os.path.join(output_dir, "acct.sql")
     core_output_file = os.path.join(output_dir, "core.sql")
-    with open(core_output_file, 'w', encoding='utf-8') as f:
-        f.write("-- Generated SQL statements for Core DB data export definitions\n")
-        f.write("-- Based on table-list.txt\n")
-        f.write(f"-- Core DB (sit_suncbs_coredb): {core_db_count} tables\n\n")
-        f.write('\n'.join(core_statements))
+
+    with open(acct_output_file, 'w', encoding='utf-8') as acct_f, \
+            open(core_output_file, 'w', encoding='utf-8') as core_f:
+        acct_f.write("-- Generated SQL statements for Accounting DB data export definitions\n")
+        acct_f.write("-- Based on table-list.txt\n")
+        acct_f.write(f"-- Accounting DB (sit_suncbs_acctdb): {acct_db_count} tables\n\n")
+
+        core_f.write("-- Generated SQL statements for Core DB data export definitions\n")
+        core_f.write("-- Based on table-list.txt\n")
+        core_f.write(f"-- Core DB (sit_suncbs_coredb): {core_db_count} tables\n\n")
+
+        for table_name in tables:
+            # data_expr_id is table name (no suffix based on the example)
+            data_expr_id = table_name
+
+            # Determine which schema this table belongs to
+            schema_name = get_schema_for_table(table_name)
+
+            # Determine data_expr_grp_code based on database
+            # Accounting DB tables use 'acct', Core DB tables use 'core'
+            if schema_name == 'sit_suncbs_acctdb':
+                data_expr_grp_code = 'acct'
+                out = acct_f
+            else:
+                data_expr_grp_code = 'core'
+                out = core_f
+
+            # Fill the shared templates for this table
+            params = {
+                'data_expr_id': data_expr_id,
+                'data_expr_grp_code': data_expr_grp_code,
+                'table_name': table_name,
+            }
+            delete_stmt = _DELETE_TMPL.format_map(params)
+
+            # SELECT clause without schema qualification
+            params['select_clause'] = _SELECT_TMPL.format_map(params)
+            insert_stmt = _INSERT_TMPL.format_map(params)
+
+            out.write(delete_stmt)
+            out.write('\n')
+            out.write(insert_stmt)
+            out.write('\n\n')  # Empty line between table statements
 
     print(f"Generated SQL statements for {len(tables)} tables")
 
@@ -114,8 +128,6 @@ def generate_sql_statements(table_list_file, output_dir):
 
 
 if __name__ == "__main__":
-    import os
-
     # Get script directory
     script_dir = os.path.dirname(os.path.abspath(__file__))
 